@@ -1,5 +1,5 @@
+import asyncio
 import sys
-import time
 import json
 import pytest
 
@@ -232,7 +232,7 @@ async def test_connection(jp_fetch, jp_ws_fetch, jp_http_port, jp_auth_header):
         )
         model = json.loads(r.body.decode())
         if model['connections'] > 0:
-            time.sleep(0.1)
+            await asyncio.sleep(0.1)
         else:
             break
 